@@ -155,17 +155,23 @@ def cached_result(
 
     """
 
+    python_major, python_minor = sys.version_info[:2]
+    cache_key_prefix = f"{prefix}:{python_major}.{python_minor}:"
+
     def cache_decorator(func: Callable) -> Callable:
+        # The key (prefix) only depends on the decorator arguments, so build it once instead of on every call
+        static_cache_key = f"{cache_key_prefix}{key_name}" if key_name else None
+        func_cache_key_prefix = f"{cache_key_prefix}{func.__name__}"
+
         @wraps(func)
         async def func_wrapper(*args: tuple[Any], **kwargs: dict[str, Any]) -> Any:
-            python_major, python_minor = sys.version_info[:2]
-            if key_name:
-                cache_key = f"{prefix}:{python_major}.{python_minor}:{key_name}"
+            if static_cache_key:
+                cache_key = static_cache_key
             else:
                 # Auto generate a cache key name based on function_name and a hash of the arguments
                 # Note: this makes no attempt to handle non-hashable values like lists and sets or other complex objects
                 args_and_kwargs_string = (args, frozenset(kwargs.items()))
-                cache_key = f"{prefix}:{python_major}.{python_minor}:{func.__name__}{args_and_kwargs_string}"
+                cache_key = f"{func_cache_key_prefix}{args_and_kwargs_string}"
                 logger.debug("Autogenerated a cache key", cache_key=cache_key)
 
             logger.debug("Cache called with wrapper func", func_name=func.__name__, cache_key=cache_key)
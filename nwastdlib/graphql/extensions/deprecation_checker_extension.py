@@ -31,9 +31,8 @@ def to_camel(s: str) -> str:
 
 
 def get_path_as_string(path: Path) -> str:
-    if path.prev:
-        return f"{get_path_as_string(path.prev)}/{path.key}"
-    return f"{path.key}"
+    # Walk the linked path iteratively; this runs for every resolved field
+    return "/".join(map(str, path.as_list()))
 
 
 def get_root_path(path: Path) -> Path:
@@ -54,18 +53,23 @@ class DeprecationCheckerExtension(SchemaExtension):
     deprecated_mutations: DeprecatedPaths = {}
 
     def resolve(self, _next: Any, root: Any, info: GraphQLResolveInfo, *args: Any, **kwargs: Any) -> Any:
-        pathstring = get_path_as_string(info.path)
         root_type = get_root_path(info.path).typename
 
-        reason = None
+        deprecated_paths: DeprecatedPaths = {}
         if root_type == "Query":
-            reason = self.deprecated_queries.get(pathstring)
+            deprecated_paths = self.deprecated_queries
         elif root_type == "Mutation":
-            reason = self.deprecated_mutations.get(pathstring)
+            deprecated_paths = self.deprecated_mutations
+
+        field_deprecation = get_field_deprecation(info)
+        if not deprecated_paths and not field_deprecation:
+            # Fast path: nothing can be reported, so skip building the path string
+            return _next(root, info, *args, **kwargs)
 
-        if reason:
+        pathstring = get_path_as_string(info.path)
+        if reason := deprecated_paths.get(pathstring):
             logger.warning("Use of deprecated path", type=root_type, path=pathstring, deprecation_reason=repr(reason))
-        elif field_deprecation := get_field_deprecation(info):
+        elif field_deprecation:
             logger.warning(
                 "Use of deprecated field",
                 field=info.field_name,
@@ -132,8 +132,8 @@ def _register(message: str, path: Collection[str | int], error_type: ErrorType)
         return
 
     logger.debug("Registering error", error=error)
+    # The bucket list is mutated in place; no need to set the contextvar again
     errors.append(error)
-    _error_bucket.set(errors)
 
 
 def register_error(message: str, info: Info, error_type: ErrorType = ErrorType.INTERNAL_ERROR) -> None:
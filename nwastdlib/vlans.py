@@ -14,11 +14,11 @@
 
 from __future__ import annotations
 
-import itertools
+import bisect
 import operator
 from collections import abc
 from collections.abc import Iterable, Iterator, Sequence
-from functools import reduce, total_ordering
+from functools import total_ordering
 from typing import AbstractSet, Any, ClassVar, Optional, Union, cast
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
@@ -42,13 +42,18 @@ def to_ranges(i: Iterable[int]) -> Iterable[range]:
         range object for each consecutive set of integers
 
     """
-    # The trick here is the key function (the lambda one) that calculates the difference between an element of the
-    # iterable `i` and its corresponding enumeration value. For consecutive values in the iterable, this difference
-    # will be the same! All these values (those with the same difference) are grouped by the `groupby` function. We
-    # return the first and last element to construct a `range` object
-    for _, g in itertools.groupby(enumerate(i), lambda t: t[1] - t[0]):
-        group = list(g)
-        yield range(group[0][1], group[-1][1] + 1)
+    # Walk the values once, keeping track of the start and end of the current run of consecutive integers. There is
+    # no need to materialize the runs; a `range` object only needs the first and last value.
+    values = iter(i)
+    if (start := next(values, None)) is None:
+        return
+    stop = start
+    for value in values:
+        if value != stop + 1:
+            yield range(start, stop + 1)
+            start = value
+        stop = value
+    yield range(start, stop + 1)
 
 
 def expand_ranges(ranges: Sequence[Sequence[int]], inclusive: bool = False) -> list[int]:
@@ -186,6 +191,10 @@ class VlanRanges(abc.Set):
         return [(vr.start, vr.stop - 1) for vr in self._vlan_ranges]
 
     def __contains__(self, key: object) -> bool:
+        if isinstance(key, int):
+            # The ranges are sorted and disjoint, hence only the last range starting at or before `key` can hold it
+            idx = bisect.bisect_right(self._vlan_ranges, key, key=operator.attrgetter("start")) - 1
+            return idx >= 0 and key in self._vlan_ranges[idx]
         return any(key in range_from_self for range_from_self in self._vlan_ranges)
 
     def __iter__(self) -> Iterator[int]:
@@ -201,8 +210,8 @@ class VlanRanges(abc.Set):
             Number of VLAN's
 
         """
-        # Utilize the __iter__ method
-        return sum(1 for _ in self)
+        # `range` objects know their own length; no need to iterate over the individual VLANs
+        return sum(len(vr) for vr in self._vlan_ranges)
 
     def __str__(self) -> str:
         # `range` objects have an exclusive `stop`. VlanRanges is expressed using terms that use an inclusive stop,
@@ -244,15 +253,14 @@ class VlanRanges(abc.Set):
         return set(self).isdisjoint(other)
 
     def union(self, *others: AbstractSet[Any]) -> VlanRanges:
-        return reduce(operator.__or__, others, self)
+        if not others:
+            return self
+        # A single set union; folding with `|` would expand and normalize an intermediate VlanRanges per operand
+        return VlanRanges(set(self).union(*others))
 
     @property
     def is_single_vlan(self) -> bool:
-        try:
-            int(str(self))
-            return True
-        except ValueError:
-            return False
+        return len(self._vlan_ranges) == 1 and len(self._vlan_ranges[0]) == 1
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> CoreSchema:
@@ -36,6 +36,19 @@ def test_vlan_ranges_str_repr():
     assert vr_from_repr == vr
 
 
+@pytest.mark.parametrize(
+    "vlans, expected",
+    [
+        ("", 0),
+        ("4", 1),
+        ("10-20", 11),
+        ("4,10-20,30", 13),
+    ],
+)
+def test_vlan_ranges_len(vlans, expected):
+    assert len(VlanRanges(vlans)) == expected
+
+
 @pytest.mark.parametrize(
     "vlan, expected",
     [
@@ -44,10 +57,14 @@ def test_vlan_ranges_str_repr():
         (9, False),
         (21, False),
         (0, False),
+        (4, True),
+        (5, False),
+        (30, True),
+        (4096, False),
     ],
 )
 def test_vlan_ranges_in(vlan, expected):
-    vr = VlanRanges("10-20")
+    vr = VlanRanges("4,10-20,30")
     assert bool(vlan in vr) is expected
 
 
@@ -174,6 +191,19 @@ def test_vlan_ranges_lt(vlans, expected):
     assert (VlanRanges(vlans) < vr) is expected
 
 
+@pytest.mark.parametrize(
+    "vlans, expected",
+    [
+        ("", False),
+        ("4", True),
+        ("4-5", False),
+        ("4,6", False),
+    ],
+)
+def test_vlan_ranges_is_single_vlan(vlans, expected):
+    assert VlanRanges(vlans).is_single_vlan is expected
+
+
 def test_vlan_ranges_hash():
     vr = VlanRanges("10-14,4,200-256")
     # Just making sure it doesn't raise an exception. Which, BTW will be raised, should the internal representation